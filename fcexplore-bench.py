@@ -15,53 +15,121 @@ all DSP files matching the pattern with these configurations.
 
 import argparse
 import itertools
-import subprocess
+import operator
+import os
 import sys
 from typing import List, Dict
 
 
-def generate_combinations(options, option_values):
-    """Generate all possible combinations of values for the options.
+def _tuple_getter(indices):
+    """Return a callable extracting the given positions of a tuple as a tuple.
 
-    Following fcexplorer.py logic:
-    - If option has empty list [], it becomes [None, ''] (absent or present as flag)
-    - If option has values, use them as-is (option always present with one of the values)
+    Unlike a bare operator.itemgetter, the result is always a tuple, even
+    for zero or one index.
     """
-    value_combinations = []
-    for opt in options:
-        if option_values[opt] == []:
-            # Empty value means flag option: can be absent (None) or present ('')
-            value_combinations.append([None, ''])
-        else:
-            # Has values: option always present with one of these values
-            value_combinations.append(option_values[opt])
-    return itertools.product(*value_combinations)
+    if not indices:
+        return lambda combination: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda combination: (combination[index],)
+    return operator.itemgetter(*indices)
+
 
+def split_options(option_values):
+    """Classify options once into flag options and valued options.
 
-def build_config_string(listopt, combination):
-    """Build a configuration string from an option combination.
+    Flag options (empty value list) are either absent or present, valued
+    options are always present with one of their values. The rest of the
+    pipeline works on these two position arrays and never looks at the
+    values again to decide how an option is rendered.
 
     Args:
-        listopt: List of option names (e.g., ['-lang', '-ss', '-fir'])
-        combination: Tuple of values (e.g., ('cpp', '0', None))
+        option_values: Dictionary mapping option names to their values,
+            in command-line order
 
     Returns:
-        Configuration string (e.g., '-lang cpp -ss 0')
+        Tuple (flag_indices, valued_indices) of option positions
+        (e.g., ([2], [0, 1]))
     """
-    parts = []
-
-    for opt, val in zip(listopt, combination):
-        if val is None:
-            # Option is absent
-            continue
-        elif val == '':
-            # Flag option (present without value)
-            parts.append(opt)
+    flag_indices = []
+    valued_indices = []
+    for i, values in enumerate(option_values.values()):
+        if values == []:
+            flag_indices.append(i)
         else:
-            # Option with value
-            parts.extend([opt, str(val)])
+            valued_indices.append(i)
+    return flag_indices, valued_indices
+
+
+def build_config_templates(option_values, flag_indices):
+    """Precompute one format string per set of present flag options.
+
+    The resulting list is indexed by a bitmask of the present flag options
+    (bit j set = j-th flag option present) and each template has one '%s'
+    per valued option, in option order. Values are the strings collected
+    by parse_faust_options and are substituted as-is.
+
+    Args:
+        option_values: Dictionary mapping option names to their values
+        flag_indices: Positions of the flag options in option_values
+
+    Returns:
+        List of 2^f format strings, f being the number of flag options
+        (e.g., ['-lang %s -ss %s', '-lang %s -ss %s -fir'])
+    """
+    flag_bits = {i: 1 << j for j, i in enumerate(flag_indices)}
+    # '%' in option names must not be taken as a format directive
+    escaped = [opt.replace('%', '%%') for opt in option_values]
+    templates = []
+
+    for mask in range(1 << len(flag_indices)):
+        parts = []
+        for i, opt in enumerate(escaped):
+            flag_bit = flag_bits.get(i)
+            if flag_bit is None:
+                # Option with value
+                parts.extend([opt, '%s'])
+            elif mask & flag_bit:
+                # Flag option (present without value)
+                parts.append(opt)
+        templates.append(' '.join(parts))
+
+    return templates
 
-    return ' '.join(parts)
+
+def generate_combinations(option_values):
+    """Lazily generate the configuration string of every option combination.
+
+    Following fcexplorer.py logic:
+    - If option has empty list [], it can be absent or present as flag
+    - If option has values, use them as-is (option always present with one of the values)
+
+    Combinations are streamed from itertools.product and turned into
+    configuration strings one at a time; the empty configuration (all
+    options absent) is skipped.
+
+    Each flag option contributes 0 (absent) or its bit (present), so the
+    sum of the flag entries of a combination indexes the precomputed
+    templates directly.
+    """
+    flag_indices, valued_indices = split_options(option_values)
+    templates = build_config_templates(option_values, flag_indices)
+
+    value_combinations = list(option_values.values())
+    for j, i in enumerate(flag_indices):
+        # Flag option: can be absent (0) or present (bit)
+        value_combinations[i] = (0, 1 << j)
+
+    combinations = itertools.product(*value_combinations)
+    if not valued_indices:
+        # Only flag options: the all-absent combination, which comes first,
+        # is the one and only empty configuration
+        next(combinations)
+
+    get_flags = _tuple_getter(flag_indices)
+    get_values = _tuple_getter(valued_indices)
+    for combination in combinations:
+        yield templates[sum(get_flags(combination))] % get_values(combination)
 
 
 def parse_arguments():
@@ -148,6 +216,10 @@ def parse_faust_options(args_list: List[str]) -> Dict[str, List[str]]:
                 option_values[current_option] = arg.split()
                 current_option = None
 
+    # Values are used verbatim when building configurations, no str() needed
+    assert all(isinstance(val, str)
+               for values in option_values.values() for val in values)
+
     return option_values
 
 
@@ -163,51 +235,44 @@ def main():
         print("Example: fcexplore-bench.py '*.dsp' -lang 'cpp ocpp' -mcd '0 2 4'")
         return 1
 
-    # Generate all combinations
-    listopt = list(option_values.keys())
-    combinations = list(generate_combinations(listopt, option_values))
-
-    # Build configuration strings
-    configs = []
-    for combination in combinations:
-        config_str = build_config_string(listopt, combination)
-        if config_str:  # Only add non-empty configurations
-            configs.append(config_str)
+    # Generate all configuration strings in a single pass
+    configs = list(generate_combinations(option_values))
 
     if not configs:
         print("Error: No configurations generated.")
         return 1
 
-    # Display configurations
-    print("=" * 70)
-    print("=== CONFIGURATION GENERATOR ===")
-    print("=" * 70)
-    print(f"File pattern: {args.file_pattern}")
-    print(f"Generated {len(configs)} configuration(s):")
-    print()
-
-    for i, config in enumerate(configs, 1):
-        print(f"  [{i}] {config}")
-
-    print()
-    print(f"Benchmark iterations: {args.iterations}")
-    print(f"Binary extension: {args.extension}")
+    # Display configurations (built as one buffer, written at once)
+    lines = [
+        "=" * 70,
+        "=== CONFIGURATION GENERATOR ===",
+        "=" * 70,
+        f"File pattern: {args.file_pattern}",
+        f"Generated {len(configs)} configuration(s):",
+        "",
+    ]
+    lines.extend(f"  [{i}] {config}" for i, config in enumerate(configs, 1))
+    lines.extend([
+        "",
+        f"Benchmark iterations: {args.iterations}",
+        f"Binary extension: {args.extension}",
+    ])
 
     if args.dry_run:
-        print()
-        print("=== DRY RUN MODE ===")
-        print("Not executing benchmark. Use without --dry-run to run.")
+        lines.extend([
+            "",
+            "=== DRY RUN MODE ===",
+            "Not executing benchmark. Use without --dry-run to run.",
+        ])
+        sys.stdout.write('\n'.join(lines) + '\n')
         return 0
 
-    print("=" * 70)
-    print()
+    lines.extend(["=" * 70, ""])
 
-    # Build fcbenchgraph command
+    # Build fcbenchgraph command with all generated configurations
+    # (each configuration is its own argv entry for execvp, no shell quoting)
     fcbenchgraph_cmd = ['fcbenchgraph.py', args.file_pattern]
-
-    # Add all generated configurations (IMPORTANT: quoted!)
-    for config in configs:
-        fcbenchgraph_cmd.append(config)  # subprocess will handle quoting
+    fcbenchgraph_cmd.extend(configs)
 
     # Add fcbenchgraph options
     fcbenchgraph_cmd.extend(['--iterations', str(args.iterations)])
@@ -223,15 +288,14 @@ def main():
         fcbenchgraph_cmd.extend(['--results-output', args.results_output])
 
     # Execute fcbenchgraph
-    print("Executing fcbenchgraph.py...")
-    print()
+    lines.extend(["Executing fcbenchgraph.py...", ""])
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()  # Keep our output ahead of fcbenchgraph's
 
+    # Nothing is left to do here: replace this process with fcbenchgraph,
+    # so its exit code is returned to the caller directly
     try:
-        result = subprocess.run(fcbenchgraph_cmd, check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"\nError executing fcbenchgraph: {e}", file=sys.stderr)
-        return e.returncode
+        os.execvp(fcbenchgraph_cmd[0], fcbenchgraph_cmd)
     except FileNotFoundError:
         print("\nError: fcbenchgraph.py not found. Make sure it's in your PATH.", file=sys.stderr)
         return 1